@@ -1,7 +1,14 @@
 import json
 import os
+import re
+import sys
 from dotenv import load_dotenv
-from typing import Optional
+from typing import Optional, Set
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 __all__ = ["Config", "ConfigMeta", "Field"]
 
@@ -10,6 +17,120 @@ __version__ = "1.0.0"
 #: A string value indicating that the type of the field is "JSON",
 JSON = "JSON"
 
+#: The ``.env`` paths that have already been loaded in this process.
+_DOTENV_LOADED: Set[Optional[str]] = set()
+
+#: The mapping that fields read their environment variables from. This is
+#: ``os.environ`` unless `Config.snapshot_env` has replaced it with a plain
+#: dict copy, which is cheaper to probe but does not see later changes.
+_ENV = os.environ
+
+#: Incremented whenever the environment snapshot is replaced or a field is
+#: rebound, so that values derived from a snapshot can tell whether they are
+#: still current.
+_ENV_GENERATION = 0
+
+
+def _set_env(env):
+    """Replace the mapping that fields read their environment variables from"""
+    global _ENV, _ENV_GENERATION
+    _ENV = env
+    _ENV_GENERATION += 1
+
+
+def _load_env(env_path=None, override=False):
+    """Load a .env file, refreshing the environment snapshot if one is in use"""
+    load_dotenv(dotenv_path=env_path, verbose=True, override=override)
+    _DOTENV_LOADED.add(env_path)
+    if _ENV is not os.environ:
+        _set_env(dict(os.environ))
+
+
+#: The common spellings of bool environment values, so that they can be
+#: resolved without allocating a lowercased copy of the raw value.
+_BOOL_MAP = {
+    "true": True,
+    "TRUE": True,
+    "True": True,
+    "false": False,
+    "FALSE": False,
+    "False": False,
+}
+
+
+def _coerce_bool(raw_val):
+    """Coerce a raw environment string into a bool"""
+    try:
+        return _BOOL_MAP[raw_val]
+    except KeyError:
+        pass
+    try:
+        return _BOOL_MAP[raw_val.lower()]
+    except KeyError:
+        raise ValueError("Bool type must be TRUE or FALSE") from None
+
+
+#: A run of digits long enough that orjson may parse it as a float rather than
+#: an exact int, as it does for integers outside the 64-bit range.
+_LONG_DIGITS = re.compile(r"\d{19}")
+
+
+def _loads(raw_val):
+    """Parse a raw environment string as JSON
+
+    Uses orjson when it is installed. Input that orjson rejects but the
+    standard library accepts (e.g. NaN/Infinity, lone surrogates) and long
+    integers that orjson would turn into floats are parsed with ``json.loads``
+    instead, so the result always matches ``json.loads``.
+    """
+    if orjson is None or _LONG_DIGITS.search(raw_val):
+        return json.loads(raw_val)
+    try:
+        return orjson.loads(raw_val)
+    except orjson.JSONDecodeError:
+        return json.loads(raw_val)
+
+
+#: Coercions that are known to return immutable values, and so can safely be
+#: cached and shared between readers. Any other coercion, including JSON and
+#: arbitrary callables, runs on every read so each reader gets a fresh value.
+_CACHEABLE_COERCIONS = frozenset({_coerce_bool, int, float, str})
+
+
+def _make_accessors(env_var, default, coerce, cache=True):
+    """Build the value accessors for a bound `Field`
+
+    Returns a ``(get, resolve)`` pair of closures specialized for the field's
+    environment variable, default and coercion: ``get()`` reads the field from
+    the environment and ``resolve(raw_val)`` coerces an already-read raw value.
+    Unless ``cache`` is false, they cache the last raw value seen and its
+    coerced result, so repeated reads of an unchanged variable skip
+    re-parsing. Fields whose coerced values may be mutable (e.g. JSON) should
+    not be cached, since every reader would share the same object.
+    """
+    #: The ``(raw_val, value)`` pair is replaced in a single assignment, so
+    #: that concurrent readers never see a value paired with the wrong raw
+    #: value.
+    cached = (None, None)
+
+    def resolve(raw_val):
+        nonlocal cached
+        if raw_val is None:
+            return default
+        if not cache:
+            return coerce(raw_val)
+        cached_raw, cached_value = cached
+        if raw_val == cached_raw:
+            return cached_value
+        value = coerce(raw_val)
+        cached = (raw_val, value)
+        return value
+
+    def get():
+        return resolve(_ENV.get(env_var))
+
+    return get, resolve
+
 
 class Field:
     """Class for definining a field on a Config class
@@ -21,33 +142,48 @@ class Field:
         env_var (str): name of the environment variable to populate this field
     """
 
+    __slots__ = (
+        "_default",
+        "_type",
+        "_env_var",
+        "_coerce",
+        "_get",
+        "_resolve",
+    )
+
     def __init__(self, default, field_type=str, env_var=None):
-        self.default = default
-        self.type = field_type
+        self._default = default
+        self._type = field_type
         self._env_var = env_var
+        self._bind()
 
     @property
     def value(self):
         """Get the current value of this field
 
         Checks the related environment variable; otherwise returns the default
-        value
+        value. For bool, int, float and str fields the coerced value is cached
+        until the environment variable changes.
         """
-        raw_val = os.environ.get(self._env_var)
-        if raw_val is None:
-            return self.default
+        return self._get()
 
-        if self.type == bool:
-            if raw_val.lower() == "true":
-                return True
-            if raw_val.lower() == "false":
-                return False
-            raise ValueError("Bool type must be TRUE or FALSE")
+    @property
+    def default(self):
+        return self._default
+
+    @default.setter
+    def default(self, value):
+        self._default = value
+        self._rebind()
 
-        if self.type == JSON:
-            return json.loads(raw_val)
+    @property
+    def type(self):
+        return self._type
 
-        return self.type(raw_val)
+    @type.setter
+    def type(self, value):
+        self._type = value
+        self._rebind()
 
     @property
     def env_var(self):
@@ -56,42 +192,102 @@ class Field:
     @env_var.setter
     def env_var(self, value):
         if not self._env_var:
-            self._env_var = value.upper()
+            self._env_var = sys.intern(value.upper())
+            self._bind()
+
+    def _bind(self):
+        """Rebuild the value accessors from the current field settings"""
+        #: Resolve the type dispatch once, rather than on every read.
+        if self._type is bool:
+            self._coerce = _coerce_bool
+        elif self._type == JSON:
+            self._coerce = _loads
+        else:
+            self._coerce = self._type
+
+        self._get, self._resolve = _make_accessors(
+            self._env_var,
+            self._default,
+            self._coerce,
+            cache=self._coerce in _CACHEABLE_COERCIONS,
+        )
+
+    def _rebind(self):
+        """Rebuild the value accessors after a setting changed on a live field"""
+        global _ENV_GENERATION
+        self._bind()
+        #: The field may already appear in cached `Config.as_dict` results.
+        _ENV_GENERATION += 1
+
+    def __reduce__(self):
+        #: The accessor closures cannot be pickled; rebuild them on load.
+        return (type(self), (self._default, self._type, self._env_var))
 
     def __repr__(self):
         return f"Field({self.default}, field_type={self.type}, env_var={self._env_var})"
 
 
+class _FieldDescriptor:
+    """Descriptor installed on Config classes for each bound `Field`
+
+    Resolves ``config.some_value`` directly to the field's value, without
+    going through ``Config.__getattr__``. It is a non-data descriptor, so a
+    value assigned on an instance takes precedence over the field. Instances
+    created with a ``config`` dictionary carry their own ``_vars``, which may
+    shadow the class field.
+    """
+
+    __slots__ = ("name", "field")
+
+    def __init__(self, name, field):
+        self.name = name
+        self.field = field
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self.field
+        if "_vars" in instance.__dict__:
+            return instance._vars[self.name].value
+        return self.field.value
+
+
 class ConfigMeta(type):
     """Config Metaclass
 
     Binds `Field` fields to the `_vars` attribute, which is a dictionary mapping
-    field names to the associated `Field` object
+    field names to the associated `Field` object, and replaces each field on
+    the class with a descriptor that resolves its value
     """
 
     def __new__(mcs, name, bases, attrs):
-        cls = super(ConfigMeta, mcs).__new__(mcs, name, bases, attrs)
-        cls._vars = {}
-
-        #: Get all of the classes in the class hierarchy in the reverse
-        #: method-resolution order, i.e. starting with ``object```, work up the
-        #: class hierarchy. [SWQ]
-        reversed_mro = list(cls.__mro__)
-        reversed_mro.reverse()
-
-        #: Preserve any fields that have been extracted out from earlier config
-        #: instantiations that are ancestors of the current one. [SWQ]
-        for mro_class in reversed_mro:
-            try:
-                cls._vars.update(mro_class._vars)
-            except Exception:
-                pass
-
-        for name, attr in list(attrs.items()):
+        #: Swap the fields out of the class namespace for their descriptors
+        #: before the class is created, rather than deleting them afterwards.
+        attrs = dict(attrs)
+        for field_name, attr in list(attrs.items()):
             if isinstance(attr, Field):
-                cls._vars[name] = attr
-                cls._vars[name].env_var = name
-                delattr(cls, name)
+                attr.env_var = field_name
+                attrs[field_name] = _FieldDescriptor(field_name, attr)
+
+        cls = super(ConfigMeta, mcs).__new__(mcs, name, bases, attrs)
+
+        #: Collect the fields in reverse method-resolution order, so that a
+        #: class earlier in the MRO overrides one later in it. This matches the
+        #: descriptor that attribute lookup finds, including under diamond
+        #: inheritance; a plain attribute shadowing an inherited field hides it
+        #: here too.
+        _vars = {}
+        for mro_class in reversed(cls.__mro__):
+            for attr_name, attr in vars(mro_class).items():
+                if isinstance(attr, _FieldDescriptor):
+                    _vars[attr_name] = attr.field
+                else:
+                    _vars.pop(attr_name, None)
+
+        #: Snapshot the bound fields so that lookups and iteration on
+        #: instances do not need to rebuild anything.
+        cls._vars = _vars
+        cls._var_items = tuple(_vars.items())
+        cls._var_names = frozenset(_vars)
         return cls
 
 
@@ -138,34 +334,107 @@ class Config(metaclass=ConfigMeta):
         """Initialize Config object
 
         Args:
+            config (dict): additional fields for this instance, mapping field
+                names to their default values
             env_path (str): path to .env file to load
         """
         if config:
+            class_vars = type(self)._vars
+            new_fields = {}
             for key, value in config.items():
-                self.__dict__[key] = Field(value)
-                print(self.__dict__)
+                #: Keys naming an existing field only override its default, so
+                #: keep that field's type and environment variable.
+                orig = class_vars.get(key)
+                if orig is None:
+                    field = Field(value)
+                    field.env_var = key
+                else:
+                    field = Field(value, field_type=orig.type, env_var=orig.env_var)
+                new_fields[key] = field
+
+            #: Shadow the class-level field bindings for this instance only.
+            self._vars = {**class_vars, **new_fields}
+            self._var_items = tuple(self._vars.items())
+            self._var_names = frozenset(self._vars)
+
+        #: The .env file is only read the first time a given path is seen; use
+        #: `reload_env` to pick up changes without a full deploy start/stop.
+        if env_path not in _DOTENV_LOADED:
+            _load_env(env_path)
+
+    @classmethod
+    def reload_env(cls, env_path=None):
+        """Re-read a .env file, overriding any previously loaded values
+
+        Args:
+            env_path (str): path to .env file to load
+        """
+        _load_env(env_path, override=True)
+
+    @classmethod
+    def snapshot_env(cls, enabled=True):
+        """Read config variables from a snapshot of the environment
 
-        #: TODO: This will only read the .env file when this class is first
-        #:       instantiated. This could pose a problem for "hot reloading"
-        #:       without a full deploy start/stop. [SWQ]
-        load_dotenv(dotenv_path=env_path, verbose=True)
+        While enabled, fields are read from a plain dict copy of
+        ``os.environ`` rather than ``os.environ`` itself. The snapshot is only
+        refreshed when a .env file is loaded, e.g. through `reload_env`, so
+        changes made to ``os.environ`` in between are not seen.
+
+        The switch is process-wide: calling this on any Config class affects
+        every Config class and instance, not just the class it is called on.
+
+        Args:
+            enabled (bool): whether to read from a snapshot; pass ``False`` to
+                go back to reading ``os.environ`` directly
+        """
+        _set_env(dict(os.environ) if enabled else os.environ)
 
     def __getattr__(self, name):
-        if name in self._vars:
+        #: Class fields are resolved by their descriptors; this is only reached
+        #: for fields added through the ``config`` dictionary, or for names
+        #: that are not config variables.
+        if name in self._var_names:
             return self._vars[name].value
         raise AttributeError("No config variable named {}".format(name))
 
     def as_dict(self) -> dict:
-        """Create a dictionary from this object"""
-        return {k: var.value for k, var in self._vars.items()}
+        """Create a dictionary from this object
+
+        While `snapshot_env` is enabled the environment cannot change between
+        .env loads, so the result is cached until the snapshot is refreshed.
+        """
+        #: Read the generation before the environment. `_set_env` replaces the
+        #: environment before bumping the generation, so a concurrent reload
+        #: can only make this result look older than it is, never newer.
+        generation = _ENV_GENERATION
+        env = _ENV
+        if env is not os.environ:
+            cached = self.__dict__.get("_as_dict_cache")
+            if cached is not None and cached[0] == generation:
+                _, result, uncached_items = cached
+                result = dict(result)
+                #: Values that may be mutable are coerced fresh rather than
+                #: shared with the cached copy.
+                for k, var in uncached_items:
+                    result[k] = var._resolve(env.get(var._env_var))
+                return result
+
+        result = {k: var._resolve(env.get(var._env_var)) for k, var in self._var_items}
+        if env is not os.environ:
+            uncached_items = tuple(
+                (k, var)
+                for k, var in self._var_items
+                if var._coerce not in _CACHEABLE_COERCIONS
+            )
+            self._as_dict_cache = (generation, result, uncached_items)
+            return dict(result)
+        return result
 
     def get(self, name, default=None):
-        _d = self.as_dict()
-        return _d.get(name, None)
+        return self._vars[name].value if name in self._var_names else default
 
     def has_key(self, name: str) -> bool:
-        _d = self.as_dict()
-        return name in _d
+        return name in self._var_names
 
     def dump(self):
         print("")
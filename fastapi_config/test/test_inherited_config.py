@@ -88,3 +88,84 @@ def test_get_dict(config):
     }
     config_dict = config.as_dict()
     assert config_dict == expected
+
+
+def test_unknown_attribute(config):
+    with pytest.raises(AttributeError):
+        config.missing
+
+
+def test_instance_assignment(config, monkeypatch):
+    config.bar = "something else"
+    assert config.bar == "something else"
+
+    monkeypatch.setattr(config, "puyo", "patched")
+    assert config.puyo == "patched"
+
+    assert SampleConfig().bar == "pica"
+    assert SampleConfig().puyo == "poyo"
+
+
+def test_config_dict_fields(monkeypatch):
+    config = SampleConfig(config={"bar": "from dict", "extra": "extra value"})
+
+    assert config.bar == "from dict"
+    assert config.extra == "extra value"
+    assert config.has_key("extra")
+    assert config.as_dict()["extra"] == "extra value"
+
+    monkeypatch.setenv("EXTRA", "from env")
+    assert config.extra == "from env"
+
+    assert SampleConfig().bar == "pica"
+    assert not SampleConfig().has_key("extra")
+
+
+def test_multiple_bases_precedence(monkeypatch):
+    class FirstConfig(Config):
+        shared = Field(default="first")
+        first_only = Field(default="first only")
+
+    class SecondConfig(Config):
+        shared = Field(default="second")
+        second_only = Field(default="second only")
+
+    class CombinedConfig(FirstConfig, SecondConfig):
+        pass
+
+    config = CombinedConfig()
+    assert config.as_dict() == {
+        "shared": "first",
+        "first_only": "first only",
+        "second_only": "second only",
+    }
+    assert config.shared == "first"
+
+    class BaseConfig(Config):
+        x = Field(default="a")
+
+    class OverrideConfig(BaseConfig):
+        x = Field(default="b")
+
+    class PassConfig(BaseConfig):
+        pass
+
+    class DiamondConfig(PassConfig, OverrideConfig):
+        pass
+
+    config = DiamondConfig()
+    assert config.x == "b"
+    assert config.as_dict()["x"] == "b"
+    assert config.get("x") == "b"
+    assert DiamondConfig(config={"other": 1}).x == "b"
+
+
+def test_config_dict_overrides_keep_field_settings(monkeypatch):
+    config = SampleConfig(config={"baz": 30})
+    assert config.baz == 30
+
+    monkeypatch.setenv("BAZ", "7")
+    assert config.baz == 30
+
+    monkeypatch.setenv("QUUX", "99")
+    assert config.baz == 99
@@ -1,4 +1,9 @@
+import math
+import os
+import pickle
+
 import pytest
+import fastapi_config
 from .. import Config, Field, JSON
 
 
@@ -64,6 +69,44 @@ def test_json_environment_variables(config, monkeypatch):
     assert config.some_obj == expected
 
 
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_matches_stdlib(config, monkeypatch, use_orjson):
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(fastapi_config, "orjson", None)
+
+    monkeypatch.setenv(
+        "SOME_OBJ",
+        '{"nan": NaN, "inf": Infinity, "big": -9223372036854775809, '
+        '"surrogate": "\\ud800", "some_list": [1, 2.5]}',
+    )
+    some_obj = config.some_obj
+
+    assert math.isnan(some_obj["nan"])
+    assert some_obj["inf"] == math.inf
+    assert some_obj["big"] == -9223372036854775809
+    assert isinstance(some_obj["big"], int)
+    assert some_obj["surrogate"] == "\ud800"
+    assert some_obj["some_list"] == [1, 2.5]
+
+
+def test_invalid_json_environment_variable(config, monkeypatch):
+    monkeypatch.setenv("SOME_OBJ", "{not json")
+    with pytest.raises(ValueError):
+        config.some_obj
+
+
+def test_json_values_are_not_shared(config, monkeypatch):
+    monkeypatch.setenv("SOME_OBJ", '{"some_list": [1]}')
+
+    config.some_obj["some_list"].append(2)
+    config.as_dict()["some_obj"]["some_list"].append(3)
+
+    assert config.some_obj == {"some_list": [1]}
+    assert SampleConfig().as_dict()["some_obj"] == {"some_list": [1]}
+
+
 def test_manual_environment_variables(config, monkeypatch):
     monkeypatch.setenv("QUUX", "30")
     assert config.baz == 30
@@ -83,3 +126,205 @@ def test_get_dict(config):
     }
     config_dict = config.as_dict()
     assert config_dict == expected
+
+
+def test_cached_value_tracks_environment(monkeypatch):
+    calls = []
+
+    def counting_int(raw_val):
+        calls.append(raw_val)
+        return int(raw_val)
+
+    monkeypatch.setattr(
+        fastapi_config,
+        "_CACHEABLE_COERCIONS",
+        fastapi_config._CACHEABLE_COERCIONS | {counting_int},
+    )
+
+    class CountingConfig(Config):
+        baz = Field(default=25, field_type=counting_int, env_var="QUUX")
+
+    config = CountingConfig()
+
+    monkeypatch.setenv("QUUX", "30")
+    assert config.baz == 30
+    assert config.baz == 30
+    assert config.as_dict()["baz"] == 30
+    assert calls == ["30"]
+
+    monkeypatch.setenv("QUUX", "40")
+    assert config.baz == 40
+
+    assert calls == ["30", "40"]
+
+    monkeypatch.delenv("QUUX")
+    assert config.baz == 25
+
+
+def test_callable_values_are_not_shared(monkeypatch):
+    class ListConfig(Config):
+        items = Field(default=[], field_type=lambda raw_val: raw_val.split(","))
+
+    config = ListConfig()
+    monkeypatch.setenv("ITEMS", "a,b")
+
+    config.items.append("zzz")
+    assert config.items == ["a", "b"]
+    assert ListConfig().as_dict()["items"] == ["a", "b"]
+
+
+def test_get_and_has_key(config, monkeypatch):
+    monkeypatch.setenv("QUUX", "30")
+
+    assert config.get("baz") == 30
+    assert config.get("missing") is None
+    assert config.get("missing", "fallback") == "fallback"
+    assert config.has_key("foo")
+    assert not config.has_key("missing")
+
+
+def test_dotenv_loaded_once(tmp_path, mocker):
+    mocker.patch.dict(os.environ, clear=True)
+    env_file = tmp_path / ".env"
+    env_file.write_text("QUUX=30\n")
+
+    config = SampleConfig(env_path=str(env_file))
+    assert config.baz == 30
+
+    env_file.write_text("QUUX=40\n")
+    config = SampleConfig(env_path=str(env_file))
+    assert config.baz == 30
+
+    SampleConfig.reload_env(env_path=str(env_file))
+    assert config.baz == 40
+
+
+@pytest.mark.parametrize(
+    "raw_val,expected",
+    [
+        ("true", True),
+        ("TRUE", True),
+        ("tRuE", True),
+        ("False", False),
+        ("fAlSe", False),
+    ],
+)
+def test_bool_environment_variables(config, monkeypatch, raw_val, expected):
+    monkeypatch.setenv("FOO", raw_val)
+    assert config.foo is expected
+
+
+def test_invalid_bool_environment_variable(config, monkeypatch):
+    monkeypatch.setenv("FOO", "yes")
+    with pytest.raises(ValueError):
+        config.foo
+
+
+def test_snapshot_env(config, mocker):
+    mocker.patch.dict(os.environ, {"QUUX": "30"})
+    SampleConfig.snapshot_env()
+    try:
+        os.environ["QUUX"] = "40"
+        assert config.baz == 30
+        assert config.as_dict()["baz"] == 30
+
+        SampleConfig.reload_env()
+        assert config.baz == 40
+    finally:
+        SampleConfig.snapshot_env(enabled=False)
+
+    os.environ["QUUX"] = "50"
+    assert config.baz == 50
+
+
+def test_snapshot_as_dict_cache(config, mocker):
+    mocker.patch.dict(os.environ, {"QUUX": "30"})
+    SampleConfig.snapshot_env()
+    try:
+        config_dict = config.as_dict()
+        assert config_dict["baz"] == 30
+
+        config_dict["baz"] = 0
+        assert config.as_dict()["baz"] == 30
+
+        os.environ["SOME_OBJ"] = '{"some_list": [1]}'
+        SampleConfig.reload_env()
+        config.as_dict()["some_obj"]["some_list"].append(2)
+        config.as_dict()["some_obj"]["some_list"].append(3)
+        assert config.as_dict()["some_obj"] == {"some_list": [1]}
+
+        del os.environ["QUUX"]
+        SampleConfig.reload_env()
+        assert config.as_dict()["baz"] == 25
+        generation = fastapi_config._ENV_GENERATION
+        SampleConfig(config={"extra": "value"})
+        assert fastapi_config._ENV_GENERATION == generation
+
+        SampleConfig.baz.default = 0
+        try:
+            assert config.as_dict()["baz"] == 0
+        finally:
+            SampleConfig.baz.default = 25
+
+        os.environ["QUUX"] = "40"
+        SampleConfig.reload_env()
+        assert config.as_dict()["baz"] == 40
+    finally:
+        SampleConfig.snapshot_env(enabled=False)
+
+
+def test_field_settings_can_change(monkeypatch):
+    class ChangingConfig(Config):
+        baz = Field(default=25, field_type=int, env_var="QUUX")
+
+    config = ChangingConfig()
+
+    ChangingConfig.baz.default = 30
+    assert config.baz == 30
+
+    monkeypatch.setenv("QUUX", "1.5")
+    ChangingConfig.baz.type = float
+    assert config.baz == 1.5
+
+
+def test_field_pickle(monkeypatch):
+    field = pickle.loads(pickle.dumps(SampleConfig.baz))
+    assert field.default == 25
+    assert field.type is int
+    assert field.env_var == "QUUX"
+
+    monkeypatch.setenv("QUUX", "30")
+    assert field.value == 30
+
+
+def test_snapshot_reload_during_as_dict(mocker):
+    mocker.patch.dict(os.environ, {"V": "10", "TRIGGER": "1"})
+
+    def reload_once(raw_val):
+        if os.environ["V"] == "10":
+            os.environ["V"] = "20"
+            Config.reload_env()
+        return raw_val
+
+    class RacyConfig(Config):
+        v = Field(default=0, field_type=int)
+        trigger = Field(default="", field_type=reload_once)
+
+    config = RacyConfig()
+    Config.snapshot_env()
+    try:
+        assert config.as_dict()["v"] == 10
+        assert config.v == 20
+        assert config.as_dict()["v"] == 20
+    finally:
+        Config.snapshot_env(enabled=False)
+
+
+class SampleField(Field):
+    pass
+
+
+def test_field_subclass_pickle():
+    field = pickle.loads(pickle.dumps(SampleField(default=25, field_type=int)))
+    assert type(field) is SampleField
+    assert field.default == 25